@@ -1,12 +1,44 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
+import asyncio
+import functools
 import json
 import os
 import re
+import sys
+import time
 import logging
+import threading
+import ahocorasick
+from collections import defaultdict
+from itertools import islice
 from datetime import datetime
+from twisted.internet import asyncioreactor, error
+
+# Install the asyncio reactor on a dedicated event loop before anything imports the default reactor
+_REACTOR_LOOP = asyncio.new_event_loop()
+try:
+    asyncioreactor.install(eventloop=_REACTOR_LOOP)
+    _REACTOR_PREINSTALLED = False
+except error.ReactorAlreadyInstalledError:
+    _REACTOR_PREINSTALLED = True
+
+from twisted.internet import reactor
+
+if _REACTOR_PREINSTALLED:
+    # Crawls require TWISTED_REACTOR to match the running reactor, otherwise every scrape fails with a 404
+    logging.getLogger(__name__).warning(
+        f"A Twisted reactor was already installed ({type(reactor).__module__}.{type(reactor).__qualname__}); "
+        f"crawls expect twisted.internet.asyncioreactor.AsyncioSelectorReactor and will fail if it differs"
+    )
+from twisted.internet.threads import blockingCallFromThread
+from scrapy import signals
+from scrapy.crawler import CrawlerRunner
+from scrapy.utils.project import get_project_settings
+from bolagsplatsen_scraper.spiders.bolagsplatsen import BolagsplatsenSpider
 
 # Swedish to English translation dictionary (90% coverage)
 TRANSLATIONS = {
@@ -34,6 +66,23 @@ TRANSLATIONS = {
     "bra": "good", "mycket": "very", "stor": "large", "liten": "small"
 }
 
+# English titles for structured content sections scraped from detail pages
+_SECTION_NAMES = {
+    'company_brief': 'Company Overview',
+    'potential': 'Growth Potential',
+    'reason_for_sale': 'Reason for Sale',
+    'price_idea': 'Pricing Details',
+    'summary': 'Summary',
+    'description': 'Description',
+    'business_activity': 'Business Activity',
+    'market': 'Market Information',
+    'competition': 'Competitive Situation'
+}
+
+# Intern the English strings since the same few values are returned for most listings
+TRANSLATIONS = {swedish: sys.intern(english) for swedish, english in TRANSLATIONS.items()}
+_SECTION_NAMES = {key: sys.intern(title) for key, title in _SECTION_NAMES.items()}
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -41,41 +90,137 @@ logger = logging.getLogger(__name__)
 # Currency conversion rate
 SEK_TO_USD = 0.095  # 1 SEK = 0.095 USD
 
+# Scraper result cache (TTL in seconds)
+_CACHE = {"data": None, "ts": 0.0, "by_id": {}, "by_category": {}, "by_location": {}, "search_docs": []}
+_CACHE_TTL = 300
+_CACHE_LOCK = asyncio.Lock()
+
+# Character-level accent folding so "Goteborg" and "Göteborg" match the same term
+_FOLD = str.maketrans({'å': 'a', 'ä': 'a', 'ö': 'o', 'Å': 'a', 'Ä': 'a', 'Ö': 'o'})
+TRANSLATIONS_FOLDED = {swedish.translate(_FOLD): english for swedish, english in TRANSLATIONS.items()}
+# Original spelling for each folded key, so "stör" is not mistaken for "stor"
+_FOLDED_TO_ORIGINAL = {swedish.translate(_FOLD): swedish for swedish in TRANSLATIONS}
+
+# Aho-Corasick automaton over all (accent-folded) Swedish terms for single-pass dictionary matching
+_AC = ahocorasick.Automaton()
+for _swedish, _english in TRANSLATIONS_FOLDED.items():
+    _AC.add_word(_swedish, (_swedish, _english))
+_AC.make_automaton()
+
+# Matches any non-digit character in a price string
+_DIGITS_RE = re.compile(r'\D')
+
+def _is_word_char(char):
+    """Check whether a character is part of a word (mirrors regex \\w)"""
+    return char.isalnum() or char == '_'
+
 def translate_text(text):
     """Translate Swedish text to English"""
     if not text:
         return text
     
-    translated = text.lower()
+    return _translate_cached(text)
+
+@functools.lru_cache(maxsize=4096)
+def _translate_cached(text):
+    """Memoized translation (categories, locations and brokers repeat across listings)"""
+    lowered = text.lower()
+    # Folding maps one character to one character, so match offsets line up with `lowered`
+    folded = lowered.translate(_FOLD)
+    # Copy untranslated text from the original to keep its casing, unless lowercasing changed its length
+    source = text if len(lowered) == len(text) else lowered
+    parts = []
+    last = 0
+    
+    # Keep only whole-word matches, then take them leftmost-longest without overlaps
+    matches = []
+    for end, (swedish, english) in _AC.iter(folded):
+        start = end - len(swedish) + 1
+        if start > 0 and _is_word_char(lowered[start - 1]):
+            continue
+        if end + 1 < len(lowered) and _is_word_char(lowered[end + 1]):
+            continue
+        # Only accept the original spelling or its fully folded (unaccented) form
+        span = lowered[start:end + 1]
+        if span != swedish and span != _FOLDED_TO_ORIGINAL[swedish]:
+            continue
+        matches.append((start, -end, english))
+    matches.sort()
     
-    # Replace Swedish words with English
-    for swedish, english in TRANSLATIONS.items():
-        translated = translated.replace(swedish, english)
+    for start, neg_end, english in matches:
+        end = -neg_end
+        if start < last:
+            continue
+        parts.append(source[last:start])
+        parts.append(english)
+        last = end + 1
     
-    # Capitalize first letter
-    return translated.capitalize()
+    parts.append(source[last:])
+    
+    # Capitalize first letter only, keeping the casing of proper nouns
+    translated = ''.join(parts)
+    return translated[:1].upper() + translated[1:]
 
 def convert_currency(price_str):
     """Convert SEK prices to USD"""
     if not price_str:
         return price_str
     
-    # Extract numbers from price string
-    numbers = re.findall(r'[\d\s]+', price_str)
-    if not numbers:
+    return _convert_currency_cached(price_str)
+
+@functools.lru_cache(maxsize=4096)
+def _convert_currency_cached(price_str):
+    """Memoized SEK to USD conversion"""
+    # Strip everything but digits from price string
+    digits = _DIGITS_RE.sub('', price_str)
+    if not digits:
         return price_str
     
-    try:
-        price = int(''.join(numbers).replace(' ', ''))
-        usd_price = round(price * SEK_TO_USD)
-        return f"${usd_price:,}"
-    except ValueError:
-        return price_str
+    usd_price = round(int(digits) * SEK_TO_USD)
+    return f"${usd_price:,}"
+
+def _run_reactor():
+    """Run the Twisted reactor forever on its own thread"""
+    asyncio.set_event_loop(_REACTOR_LOOP)
+    reactor.run(installSignalHandlers=False)
+
+# Start a long-running reactor so crawls can be scheduled repeatedly within one process
+_REACTOR_THREAD = threading.Thread(target=_run_reactor, name="twisted-reactor", daemon=True)
+_REACTOR_THREAD.start()
+
+# Project settings configured once for in-memory scraping and shared by every crawl
+_SETTINGS = get_project_settings()
+logger.info(f"Project settings loaded from: {_SETTINGS.get('SETTINGS_MODULE')}")
+_SETTINGS.set('FEEDS', {})  # Disable file output
+_SETTINGS.set('LOG_LEVEL', 'INFO')  # Increase logging for debugging
+_SETTINGS.set('ROBOTSTXT_OBEY', False)
+_SETTINGS.set('DOWNLOAD_DELAY', 1)
+_SETTINGS.set('CONCURRENT_REQUESTS', 1)
+_SETTINGS.set('TWISTED_REACTOR', 'twisted.internet.asyncioreactor.AsyncioSelectorReactor')
+_SETTINGS.set('ITEM_PIPELINES', {})  # Items are collected via the item_scraped signal in _crawl
+
+# Crawler runner on the persistent reactor
+_RUNNER = CrawlerRunner(_SETTINGS)
+
+def _crawl():
+    """Start a bolagsplatsen crawl (on the reactor thread), resolving to the scraped items"""
+    items = []
+    
+    def collect_item(item):
+        items.append(item)
+    
+    crawler = _RUNNER.create_crawler(BolagsplatsenSpider)
+    # weak=False: the local collector would otherwise be garbage collected mid-crawl
+    crawler.signals.connect(collect_item, signal=signals.item_scraped, weak=False)
+    deferred = _RUNNER.crawl(crawler)
+    deferred.addCallback(lambda _: items)
+    return deferred
 
 app = FastAPI(
     title="Bolagsplatsen Scraper API",
     description="API for scraping business listings from Bolagsplatsen",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -99,6 +244,7 @@ class BusinessListing(BaseModel):
     business_name: Optional[str] = None
     contact_name: Optional[str] = None
     phone_number: Optional[str] = None
+    product_id: Optional[str] = None
 
 def run_scraper():
     """Run the Scrapy spider and return the data in real-time"""
@@ -107,71 +253,33 @@ def run_scraper():
         current_dir = os.getcwd()
         logger.info(f"Running scraper from directory: {current_dir}")
         
-        # Import Scrapy components for in-memory scraping
-        from scrapy.crawler import CrawlerProcess
-        from scrapy.utils.project import get_project_settings
-        
-        # Get project settings
-        settings = get_project_settings()
-        logger.info(f"Project settings loaded from: {settings.get('SETTINGS_MODULE')}")
-        
-        # Configure settings for in-memory scraping
-        settings.set('FEEDS', {})  # Disable file output
-        settings.set('LOG_LEVEL', 'INFO')  # Increase logging for debugging
-        settings.set('ROBOTSTXT_OBEY', False)
-        settings.set('DOWNLOAD_DELAY', 1)
-        settings.set('CONCURRENT_REQUESTS', 1)
-        
-        # Debug: Print current settings
-        logger.info(f"Scrapy settings: {dict(settings)}")
-        
-        # Create crawler process
-        process = CrawlerProcess(settings)
-        
-        # Add the spider
-        logger.info("Adding bolagsplatsen spider to process")
-        
-        # Check if spider is available
-        try:
-            from bolagsplatsen_scraper.spiders.bolagsplatsen import BolagsplatsenSpider
-            logger.info("Spider class imported successfully")
-        except Exception as e:
-            logger.error(f"Failed to import spider: {e}")
-            return []
-        
-        # Import our memory collection pipeline
-        from bolagsplatsen_scraper.pipelines import MemoryCollectionPipeline
-        
-        # Create pipeline instance
-        pipeline = MemoryCollectionPipeline()
-        
-        # Configure settings to use our pipeline
-        settings.set('ITEM_PIPELINES', {'bolagsplatsen_scraper.pipelines.MemoryCollectionPipeline': 400})
-        
-        # Create crawler process
-        process = CrawlerProcess(settings)
-        
-        # Add the spider
-        logger.info("Adding bolagsplatsen spider to process")
-        process.crawl('bolagsplatsen')
-        
-        # Start the crawling process
-        logger.info("Starting crawler process")
+        # Schedule the crawl on the reactor thread and wait for it to finish
+        logger.info("Starting bolagsplatsen crawl")
         try:
-            process.start()
-            logger.info("Crawler process completed successfully")
+            scraped_items = blockingCallFromThread(reactor, _crawl)
+            logger.info("Crawl completed successfully")
         except Exception as e:
-            logger.error(f"Crawler process failed: {e}")
+            logger.error(f"Crawl failed: {e}")
             return []
         
-        # Get collected items from pipeline
-        scraped_items = pipeline.get_collected_items()
         logger.info(f"Scraper completed, collected {len(scraped_items)} items")
         
         if scraped_items:
-            # Transform the data to match the expected format with translation and USD conversion
-            transformed_data = []
+            # Translate each distinct short field value once (these repeat heavily across listings)
+            lookup_fields = ('title', 'category', 'location', 'broker_name', 'broker_company')
+            unique_values = {item.get(field, '') for item in scraped_items for field in lookup_fields}
+            translated_values = {value: sys.intern(translate_text(value)) for value in unique_values}
+            
+            # Transform the data to match the expected format with translation and USD conversion,
+            # skipping duplicates (same raw title and link) before any per-item translation work
+            seen = set()
+            unique_data = []
             for item in scraped_items:
+                key = (item.get('title', ''), item.get('url', ''))
+                if key in seen:
+                    continue
+                seen.add(key)
+                
                 # Create details sections from the scraped data
                 details_sections = []
                 
@@ -184,24 +292,11 @@ def run_scraper():
                     })
                 
                 # Add structured content sections if available
-                if item.get('structured_content'):
-                    structured_content = item.get('structured_content', {})
+                structured_content = item.get('structured_content')
+                if structured_content:
                     for section_key, section_content in structured_content.items():
                         if section_content and len(section_content.strip()) > 20:
-                            # Translate section names
-                            section_names = {
-                                'company_brief': 'Company Overview',
-                                'potential': 'Growth Potential',
-                                'reason_for_sale': 'Reason for Sale',
-                                'price_idea': 'Pricing Details',
-                                'summary': 'Summary',
-                                'description': 'Description',
-                                'business_activity': 'Business Activity',
-                                'market': 'Market Information',
-                                'competition': 'Competitive Situation'
-                            }
-                            
-                            section_title = section_names.get(section_key, section_key.replace('_', ' ').title())
+                            section_title = _SECTION_NAMES.get(section_key, section_key.replace('_', ' ').title())
                             details_sections.append({
                                 "infoSummary": section_title,
                                 "infoItems": [translate_text(section_content)]
@@ -209,20 +304,26 @@ def run_scraper():
                 
                 # Add financial metrics section
                 financial_items = []
-                if item.get('revenue'):
-                    financial_items.append(f"Revenue: {translate_text(item.get('revenue', ''))}")
-                if item.get('detailed_revenue'):
-                    financial_items.append(f"Detailed Revenue: {translate_text(item.get('detailed_revenue', ''))}")
-                if item.get('profit_status'):
-                    financial_items.append(f"Profit Status: {translate_text(item.get('profit_status', ''))}")
-                if item.get('detailed_profit'):
-                    financial_items.append(f"Detailed Profit: {translate_text(item.get('detailed_profit', ''))}")
-                if item.get('price'):
-                    financial_items.append(f"Asking Price: {convert_currency(item.get('price', ''))}")
+                revenue = item.get('revenue')
+                if revenue:
+                    financial_items.append(f"Revenue: {translate_text(revenue)}")
+                detailed_revenue = item.get('detailed_revenue')
+                if detailed_revenue:
+                    financial_items.append(f"Detailed Revenue: {translate_text(detailed_revenue)}")
+                profit_status = item.get('profit_status')
+                if profit_status:
+                    financial_items.append(f"Profit Status: {translate_text(profit_status)}")
+                detailed_profit = item.get('detailed_profit')
+                if detailed_profit:
+                    financial_items.append(f"Detailed Profit: {translate_text(detailed_profit)}")
+                price = convert_currency(item.get('price', ''))
+                if price:
+                    financial_items.append(f"Asking Price: {price}")
                 
                 # Add additional financial details
-                if item.get('financial_details'):
-                    for detail in item.get('financial_details', []):
+                financial_details = item.get('financial_details')
+                if financial_details:
+                    for detail in financial_details:
                         financial_items.append(translate_text(detail))
                 
                 if financial_items:
@@ -233,8 +334,9 @@ def run_scraper():
                 
                 # Add business metrics section
                 business_items = []
-                if item.get('employee_count'):
-                    business_items.append(f"Employees: {translate_text(item.get('employee_count', ''))}")
+                employee_count = item.get('employee_count')
+                if employee_count:
+                    business_items.append(f"Employees: {translate_text(employee_count)}")
                 
                 if business_items:
                     details_sections.append({
@@ -244,14 +346,18 @@ def run_scraper():
                 
                 # Add contact information section
                 contact_items = []
-                if item.get('phone'):
-                    contact_items.append(f"Phone: {item.get('phone', '')}")
-                if item.get('email'):
-                    contact_items.append(f"Email: {item.get('email', '')}")
-                if item.get('broker_name'):
-                    contact_items.append(f"Broker: {translate_text(item.get('broker_name', ''))}")
-                if item.get('broker_company'):
-                    contact_items.append(f"Broker Company: {translate_text(item.get('broker_company', ''))}")
+                phone = item.get('phone')
+                if phone:
+                    contact_items.append(f"Phone: {phone}")
+                email = item.get('email')
+                if email:
+                    contact_items.append(f"Email: {email}")
+                broker_name = item.get('broker_name', '')
+                if broker_name:
+                    contact_items.append(f"Broker: {translated_values[broker_name]}")
+                broker_company = item.get('broker_company', '')
+                if broker_company:
+                    contact_items.append(f"Broker Company: {translated_values[broker_company]}")
                 
                 if contact_items:
                     details_sections.append({
@@ -260,36 +366,28 @@ def run_scraper():
                     })
                 
                 # Transform the item to match expected format with translation and USD conversion
+                title = translated_values[item.get('title', '')]
+                category = translated_values[item.get('category', '')]
                 transformed_item = {
-                    "title": translate_text(item.get('title', '')),
-                    "company": translate_text(item.get('broker_company', item.get('broker_name', ''))),
-                    "location": translate_text(item.get('location', '')),
-                    "price": convert_currency(item.get('price', '')),
-                    "category": translate_text(item.get('category', '')),
-                    "industry": translate_text(item.get('category', '')),  # Using category as industry
+                    "title": title,
+                    "company": translated_values[item.get('broker_company', broker_name)],
+                    "location": translated_values[item.get('location', '')],
+                    "price": price,
+                    "category": category,
+                    "industry": category,  # Using category as industry
                     "link": item.get('url', ''),
                     "details": details_sections,
-                    "business_name": translate_text(item.get('title', '')),
-                    "contact_name": translate_text(item.get('broker_name', '')),
-                    "phone_number": item.get('phone', 'Contact via website')
+                    "business_name": title,
+                    "contact_name": translated_values[broker_name],
+                    "phone_number": phone if phone is not None else 'Contact via website',
+                    "product_id": item.get('product_id')
                 }
                 
-                transformed_data.append(transformed_item)
+                unique_data.append(transformed_item)
             
-            # Remove duplicates based on title and link
-            seen_titles = set()
-            seen_links = set()
-            unique_data = []
-            
-            for item in transformed_data:
-                title = item.get('title', '')
-                link = item.get('link', '')
-                
-                # Check if we've seen this title or link before
-                if title not in seen_titles and link not in seen_links:
-                    seen_titles.add(title)
-                    seen_links.add(link)
-                    unique_data.append(item)
+            # Log memoization hit ratios to help size the caches
+            logger.info(f"Translation cache: {_translate_cached.cache_info()}")
+            logger.info(f"Currency cache: {_convert_currency_cached.cache_info()}")
             
             return unique_data
         else:
@@ -300,6 +398,65 @@ def run_scraper():
         logger.error(f"Exception in run_scraper: {str(e)}")
         return []
 
+def _cache_is_fresh():
+    """Check whether the cached scraper results are still within the TTL"""
+    return _CACHE["data"] is not None and time.time() - _CACHE["ts"] < _CACHE_TTL
+
+def _index_listings(data):
+    """Build lookup indexes over listings by product ID, category, location and search text"""
+    by_id = {}
+    by_category = defaultdict(list)
+    by_location = defaultdict(list)
+    for item in data:
+        # Keep the first listing for a repeated product ID, as the old linear lookup did
+        if item.get("product_id"):
+            by_id.setdefault(item["product_id"], item)
+        by_category[item.get("category")].append(item)
+        by_location[item.get("location")].append(item)
+    
+    return {
+        "by_id": by_id,
+        "by_category": dict(by_category),
+        "by_location": dict(by_location),
+        # Title, company, category and location lowercased once per listing for /search
+        "search_docs": [
+            ('\n'.join([
+                item.get("title", ""),
+                item.get("company", ""),
+                item.get("category", ""),
+                item.get("location", "")
+            ]).lower(), item)
+            for item in data
+        ]
+    }
+
+async def get_cached_data():
+    """Return cached scraper results, running the scraper only when the cache has expired"""
+    if _cache_is_fresh():
+        return _CACHE["data"]
+    
+    # Concurrent requests wait here so only one of them triggers a crawl
+    async with _CACHE_LOCK:
+        if _cache_is_fresh():
+            return _CACHE["data"]
+        
+        # Run the blocking crawl in a worker thread so the event loop keeps serving other requests
+        data = await asyncio.get_running_loop().run_in_executor(None, run_scraper)
+        
+        # Only cache successful scrapes so failures are retried on the next request
+        if data:
+            _CACHE.update(_index_listings(data))
+            _CACHE["data"] = data
+            _CACHE["ts"] = time.time()
+        
+        return data
+
+def invalidate_cache():
+    """Drop cached scraper results so the next request re-runs the scraper"""
+    _CACHE.update(_index_listings([]))
+    _CACHE["data"] = None
+    _CACHE["ts"] = 0.0
+
 @app.get("/")
 async def root():
     """Root endpoint with API information"""
@@ -312,6 +469,7 @@ async def root():
             "/listings": "Get all scraped listings",
             "/listings/{product_id}": "Get specific listing by product ID",
             "/search": "Search listings by query parameters",
+            "/refresh": "Invalidate cached listings (POST)",
             "/health": "Health check endpoint"
         }
     }
@@ -325,17 +483,27 @@ async def health_check():
         "service": "Bolagsplatsen Scraper API"
     }
 
+@app.post("/refresh")
+async def refresh():
+    """Invalidate the scraper cache so the next request fetches fresh listings"""
+    invalidate_cache()
+    return {
+        "status": "cache invalidated",
+        "timestamp": datetime.now().isoformat()
+    }
+
 @app.get("/scrap")
 async def scrap():
     """Main endpoint for n8n workflow - returns data in expected format"""
-    data = run_scraper()
+    data = await get_cached_data()
     
     if not data:
         raise HTTPException(status_code=404, detail="No data available or scraping failed.")
     
     return data
 
-@app.get("/listings", response_model=List[BusinessListing])
+# Schema documented via `responses` only so cached listings skip per-item Pydantic validation
+@app.get("/listings", responses={200: {"model": List[BusinessListing]}})
 async def get_listings(
     limit: Optional[int] = None,
     offset: Optional[int] = 0,
@@ -343,18 +511,19 @@ async def get_listings(
     location: Optional[str] = None
 ):
     """Get all scraped listings with optional filtering and pagination"""
-    # Run scraper and get data
-    data = run_scraper()
+    # Get (cached) scraper data
+    data = await get_cached_data()
     
     if not data:
         raise HTTPException(status_code=404, detail="No data available or scraping failed.")
     
-    # Apply filters
+    # Apply filters using the prebuilt category/location buckets
     if category:
-        data = [item for item in data if item.get("category") == category]
-    
-    if location:
-        data = [item for item in data if item.get("location") == location]
+        data = _CACHE["by_category"].get(category, [])
+        if location:
+            data = [item for item in data if item.get("location") == location]
+    elif location:
+        data = _CACHE["by_location"].get(location, [])
     
     # Apply pagination
     if offset:
@@ -368,45 +537,31 @@ async def get_listings(
 @app.get("/listings/{product_id}", response_model=BusinessListing)
 async def get_listing(product_id: str):
     """Get a specific listing by product ID"""
-    data = run_scraper()
+    data = await get_cached_data()
     
     if not data:
         raise HTTPException(status_code=404, detail="No data available or scraping failed.")
     
-    for item in data:
-        if item.get("product_id") == product_id:
-            return item
+    item = _CACHE["by_id"].get(product_id)
+    if item is not None:
+        return item
     
     raise HTTPException(status_code=404, detail=f"Listing with product ID {product_id} not found")
 
 @app.get("/search")
 async def search_listings(
     q: str,
-    limit: Optional[int] = 50
+    limit: int = Query(50, ge=0)
 ):
     """Search listings by text query"""
-    data = run_scraper()
+    data = await get_cached_data()
     
     if not data:
         raise HTTPException(status_code=404, detail="No data available or scraping failed.")
     
+    # Match against the prebuilt lowercase search documents, stopping once limit is reached
     query = q.lower()
-    results = []
-    
-    for item in data:
-        # Search in title, description, category, and location
-        searchable_fields = [
-            item.get("title", ""),
-            item.get("company", ""),
-            item.get("category", ""),
-            item.get("location", "")
-        ]
-        
-        if any(query in field.lower() for field in searchable_fields):
-            results.append(item)
-            
-        if len(results) >= limit:
-            break
+    results = list(islice((item for doc, item in _CACHE["search_docs"] if query in doc), limit))
     
     return {
         "query": q,
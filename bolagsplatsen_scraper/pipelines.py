@@ -6,6 +6,9 @@
 
 # useful for handling different item types with a single interface
 from itemadapter import ItemAdapter
+import logging
+
+_log = logging.getLogger(__name__)
 
 
 class BolagsplatsenScraperPipeline:
@@ -21,11 +24,9 @@ class MemoryCollectionPipeline:
     
     def process_item(self, item, spider):
         """Collect each item in memory"""
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"MemoryCollectionPipeline processing item: {type(item)}")
+        _log.info("MemoryCollectionPipeline processing item: %s", type(item))
         self.collected_items.append(item)
-        logger.info(f"MemoryCollectionPipeline now has {len(self.collected_items)} items")
+        _log.info("MemoryCollectionPipeline now has %d items", len(self.collected_items))
         return item
     
     def get_collected_items(self):
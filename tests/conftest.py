@@ -0,0 +1,32 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import api
+
+LISTINGS = [
+    {"title": "Hotel in Stockholm", "company": "Anna", "category": "Hotel", "location": "Stockholm", "product_id": "1"},
+    {"title": "Hotel in Malmö", "company": "Erik", "category": "Hotel", "location": "Malmö", "product_id": "2"},
+    {"title": "Trade company", "company": "Anna", "category": "Trade", "location": "Stockholm", "product_id": "3"},
+    {"title": "Trade company (relisted)", "company": "Anna", "category": "Trade", "location": "Malmö", "product_id": "3"},
+]
+
+
+@pytest.fixture
+def scraper_calls(monkeypatch):
+    """Replace run_scraper with a canned result and record how often it is called"""
+    calls = []
+
+    def fake_run_scraper():
+        calls.append(1)
+        return [dict(item) for item in LISTINGS]
+
+    monkeypatch.setattr(api, "run_scraper", fake_run_scraper)
+    api.invalidate_cache()
+    yield calls
+    api.invalidate_cache()
+
+
+@pytest.fixture
+def client(scraper_calls):
+    with TestClient(api.app) as client:
+        yield client
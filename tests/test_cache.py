@@ -0,0 +1,47 @@
+import asyncio
+import time
+
+import api
+
+
+def test_requests_within_ttl_scrape_once(client, scraper_calls):
+    assert client.get("/scrap").status_code == 200
+    assert client.get("/listings").status_code == 200
+    assert len(scraper_calls) == 1
+
+
+def test_refresh_forces_new_scrape(client, scraper_calls):
+    client.get("/scrap")
+    assert client.post("/refresh").status_code == 200
+    client.get("/scrap")
+    assert len(scraper_calls) == 2
+
+
+def test_expired_cache_scrapes_again(client, scraper_calls, monkeypatch):
+    client.get("/scrap")
+    monkeypatch.setitem(api._CACHE, "ts", time.time() - api._CACHE_TTL - 1)
+    client.get("/scrap")
+    assert len(scraper_calls) == 2
+
+
+def test_concurrent_misses_collapse_into_one_scrape(monkeypatch):
+    calls = []
+
+    def slow_run_scraper():
+        calls.append(1)
+        time.sleep(0.2)
+        return [{"title": "Hotel"}]
+
+    monkeypatch.setattr(api, "run_scraper", slow_run_scraper)
+    api.invalidate_cache()
+
+    async def fetch_concurrently():
+        return await asyncio.gather(*(api.get_cached_data() for _ in range(3)))
+
+    try:
+        results = asyncio.run(fetch_concurrently())
+    finally:
+        api.invalidate_cache()
+
+    assert len(calls) == 1
+    assert all(result == [{"title": "Hotel"}] for result in results)
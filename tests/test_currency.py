@@ -0,0 +1,14 @@
+from api import convert_currency
+
+
+def test_price_with_spaces_and_suffix():
+    assert convert_currency("1 500 000 kr") == "$142,500"
+
+
+def test_price_without_digits_is_unchanged():
+    assert convert_currency("Pris saknas") == "Pris saknas"
+
+
+def test_empty_price_passes_through():
+    assert convert_currency(None) is None
+    assert convert_currency("") == ""
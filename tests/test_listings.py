@@ -0,0 +1,31 @@
+def test_listing_by_id(client):
+    response = client.get("/listings/2")
+    assert response.status_code == 200
+    assert response.json()["title"] == "Hotel in Malmö"
+
+
+def test_repeated_product_id_returns_first_listing(client):
+    assert client.get("/listings/3").json()["title"] == "Trade company"
+
+
+def test_unknown_product_id_is_404(client):
+    assert client.get("/listings/999").status_code == 404
+
+
+def test_filter_by_category(client):
+    titles = [item["title"] for item in client.get("/listings", params={"category": "Hotel"}).json()]
+    assert titles == ["Hotel in Stockholm", "Hotel in Malmö"]
+
+
+def test_filter_by_location(client):
+    titles = [item["title"] for item in client.get("/listings", params={"location": "Malmö"}).json()]
+    assert titles == ["Hotel in Malmö", "Trade company (relisted)"]
+
+
+def test_filter_by_category_and_location(client):
+    response = client.get("/listings", params={"category": "Trade", "location": "Stockholm"})
+    assert [item["title"] for item in response.json()] == ["Trade company"]
+
+
+def test_filter_with_no_match_is_empty(client):
+    assert client.get("/listings", params={"category": "Restaurant"}).json() == []
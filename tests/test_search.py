@@ -0,0 +1,22 @@
+def test_search_is_case_insensitive_across_fields(client):
+    response = client.get("/search", params={"q": "STOCKHOLM"})
+    assert response.status_code == 200
+    assert [item["title"] for item in response.json()["results"]] == ["Hotel in Stockholm", "Trade company"]
+
+
+def test_search_matches_company(client):
+    assert client.get("/search", params={"q": "erik"}).json()["total_found"] == 1
+
+
+def test_search_respects_limit(client):
+    body = client.get("/search", params={"q": "anna", "limit": 2}).json()
+    assert body["total_found"] == 2
+
+
+def test_search_does_not_match_across_fields(client):
+    # Company "Anna" followed by category "Hotel" must not match as one phrase
+    assert client.get("/search", params={"q": "anna hotel"}).json()["total_found"] == 0
+
+
+def test_search_negative_limit_is_rejected(client):
+    assert client.get("/search", params={"q": "a", "limit": -1}).status_code == 422
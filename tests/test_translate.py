@@ -0,0 +1,23 @@
+from api import translate_text
+
+
+def test_whole_word_match_inside_longer_non_word_match():
+    # "e-handel" fails the word boundary check here, so the inner "handel" must still translate
+    assert translate_text("ee-handel") == "Ee-trade"
+    assert translate_text("kope-handel") == "Kope-trade"
+
+
+def test_longest_match_wins():
+    assert translate_text("e-handel") == "E-commerce"
+
+
+def test_untranslated_proper_nouns_keep_their_casing():
+    assert translate_text("Anna Svensson") == "Anna Svensson"
+    assert translate_text("Café i Lund") == "Café i Lund"
+    assert translate_text("Hotell i Göteborg") == "Hotel i Gothenburg"
+
+
+def test_accent_folding_only_matches_original_or_unaccented_spelling():
+    assert translate_text("Goteborg") == "Gothenburg"
+    assert translate_text("göteborg") == "Gothenburg"
+    assert translate_text("stör inte") == "Stör inte"